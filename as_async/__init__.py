@@ -1,26 +1,229 @@
 import asyncio
+import contextvars
 import functools
-from concurrent.futures import Executor
-from typing import Any, AsyncGenerator, Callable, Coroutine, Generator, cast
+import inspect
+import itertools
+import os
+import threading
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, AsyncGenerator, Callable, Coroutine, Generator
+
+_DEFAULT_EXECUTOR: ThreadPoolExecutor | None = None
+_DEFAULT_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """
+    Lazily create the executor used when none is passed in. asyncio's own default pool is
+    sized for CPU work (`min(32, os.cpu_count() + 4)`), which queues up quickly when
+    wrapping blocking I/O, so the size is taken from the `AS_ASYNC_THREAD_POOL_SIZE`
+    environment variable instead. This is always a thread pool: a `ProcessPoolExecutor`
+    would have to pickle every call, and cannot run generators at all.
+    """
+    global _DEFAULT_EXECUTOR
+    if _DEFAULT_EXECUTOR is None:
+        with _DEFAULT_EXECUTOR_LOCK:
+            if _DEFAULT_EXECUTOR is None:
+                _DEFAULT_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=int(os.environ.get("AS_ASYNC_THREAD_POOL_SIZE", "64")),
+                    thread_name_prefix="as_async",
+                )
+    return _DEFAULT_EXECUTOR
+
+
+def _pull_next[T](it: Generator[T, Any, None]) -> tuple[bool, T | None]:
+    try:
+        return True, it.__next__()
+    except StopIteration:
+        return False, None
+
+
+def _pull_chunk[T](
+    it: Generator[T, Any, None], size: int
+) -> tuple[list[T], bool, BaseException | None]:
+    """
+    Pull up to `size` items from `it`. Returns the items, whether `it` is exhausted, and
+    the error it raised, if any, so items pulled before the error are not lost.
+    """
+    items: list[T] = []
+    try:
+        items.extend(itertools.islice(it, size))
+    except BaseException as exc:
+        return items, True, exc
+    return items, len(items) < size, None
+
+
+def _drain[T](
+    it: Generator[T, Any, None],
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue[tuple[bool, Any]],
+    slots: threading.Semaphore,
+    stopped: threading.Event,
+) -> None:
+    """
+    Push every item of `it` onto `queue` from a worker thread. `slots` bounds the number of
+    items in flight, and `stopped` is set when the consumer goes away. Exhaustion is
+    signalled with `(False, None)` and errors with `(False, exception)`.
+    """
+    put = queue.put_nowait
+    while True:
+        slots.acquire()
+        if stopped.is_set():
+            return
+        try:
+            message = (True, it.__next__())
+        except StopIteration:
+            message = (False, None)
+        except BaseException as exc:
+            message = (False, exc)
+        try:
+            loop.call_soon_threadsafe(put, message)
+        except RuntimeError:  # the loop has been closed
+            return
+        if not message[0]:
+            return
+
+
+def _report_drain_failure(
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue[tuple[bool, Any]],
+    future: Future[None],
+) -> None:
+    """
+    Done-callback for the `_drain` task. If it was cancelled or failed before posting a
+    final message, post one, so the consumer doesn't wait on `queue` forever.
+    """
+    exc = CancelledError() if future.cancelled() else future.exception()
+    if exc is None:
+        return
+    try:
+        loop.call_soon_threadsafe(queue.put_nowait, (False, exc))
+    except RuntimeError:  # the loop has been closed
+        pass
+
+
+def _fast_wraps[W: Callable[..., Any]](wrapper: W, wrapped: Callable[..., Any]) -> W:
+    """
+    A trimmed down `functools.wraps`, which copies the naming attributes and sets
+    `__wrapped__` but skips `__dict__`, `__annotations__` and `__type_params__`. Tools
+    that need those can reach them through `__wrapped__`, as `inspect.signature` does.
+    """
+    wrapper.__module__ = getattr(wrapped, "__module__", wrapper.__module__)
+    wrapper.__name__ = getattr(wrapped, "__name__", wrapper.__name__)
+    wrapper.__qualname__ = getattr(wrapped, "__qualname__", wrapper.__qualname__)
+    wrapper.__doc__ = getattr(wrapped, "__doc__", None)
+    wrapper.__wrapped__ = wrapped
+    return wrapper
+
+
+_WRAPPER_SOURCE = """\
+async def wrapper({params}):
+    return await {run}({executor}, {target}{args})
+"""
+
+
+def _specialize[**P, T](
+    func: Callable[P, T],
+    loop: asyncio.AbstractEventLoop | None,
+    executor: Executor | None,
+    propagate_context: bool,
+) -> Callable[P, Coroutine[None, None, T]] | None:
+    """
+    Generate a wrapper with the exact positional parameters of `func`, so calls are
+    forwarded straight to `run_in_executor` without packing `*args` and `**kwargs`.
+    Returns None when the signature can't be reproduced that way (keyword-only or
+    variadic parameters, or no signature at all).
+    """
+    try:
+        parameters = list(
+            inspect.signature(func, follow_wrapped=False).parameters.values()
+        )
+    except (TypeError, ValueError):  # some builtins have no signature
+        return None
+
+    namespace: dict[str, Any] = {
+        "_as_async_func": func,
+        "_as_async_run": loop.run_in_executor if loop is not None else None,
+        "_as_async_executor": executor,
+        "_as_async_get_loop": asyncio.get_running_loop,
+        "_as_async_get_executor": _get_default_executor,
+        "_as_async_copy_context": contextvars.copy_context,
+    }
+    params = []
+    for i, param in enumerate(parameters):
+        if param.kind not in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            return None
+        if param.name.startswith("_as_async_"):
+            return None
+        if param.default is param.empty:
+            params.append(param.name)
+        else:
+            namespace[f"_as_async_default_{i}"] = param.default
+            params.append(f"{param.name}=_as_async_default_{i}")
+        if param.kind is param.POSITIONAL_ONLY and (
+            i + 1 == len(parameters)
+            or parameters[i + 1].kind is not param.POSITIONAL_ONLY
+        ):
+            params.append("/")
+
+    # Whatever is already known at decoration time is baked into the source, so calls
+    # don't re-check `loop` and `executor` for None.
+    source = _WRAPPER_SOURCE.format(
+        params=", ".join(params),
+        run=(
+            "_as_async_run"
+            if loop is not None
+            else "_as_async_get_loop().run_in_executor"
+        ),
+        executor=(
+            "_as_async_executor" if executor is not None else "_as_async_get_executor()"
+        ),
+        target=(
+            "_as_async_copy_context().run, _as_async_func"
+            if propagate_context
+            else "_as_async_func"
+        ),
+        args="".join(f", {param.name}" for param in parameters),
+    )
+    exec(compile(source, "<as_async wrapper>", "exec"), namespace)
+    return _fast_wraps(namespace["wrapper"], func)
 
 
 def to_async[**P, T](
     func: Callable[P, T],
     loop: asyncio.AbstractEventLoop | None = None,
     executor: Executor | None = None,
+    inline: bool = False,
+    propagate_context: bool = False,
 ) -> Callable[P, Coroutine[None, None, T]]:
     """
     The `to_async` function is used to convert a synchronous function into an asynchronous
     one by running it in a separate thread, effectively making it non-blocking. This is
     useful when you have a CPU-bound or I/O-bound function that you don't want to block
-    the event loop, and which would be difficult to reimplement as async.
+    the event loop, and which would be difficult to reimplement as async. If `func` is
+    already a coroutine function it is returned unchanged.
 
     Args:
         func (Callable): The synchronous function to convert to asynchronous.
         loop (asyncio.AbstractEventLoop, optional): The event loop to run the blocking function on.
-        Defaults to `asyncio.get_event_loop()`.
+        Defaults to the running loop, so calls must be made from inside one.
         executor (Executor, optional): The executor to run the blocking function on.
-        This can affect performance, check asyncio docs for info. Defaults to None.
+        This can affect performance, check asyncio docs for info. Defaults to a shared
+        `ThreadPoolExecutor` with `AS_ASYNC_THREAD_POOL_SIZE` (default 64) workers.
+        inline (bool, optional): Call the function directly on the event loop thread and
+        then yield to the loop once, instead of using the executor. This blocks the event
+        loop while the function runs, so only use it for functions that finish faster
+        than a thread hop. Defaults to False.
+        propagate_context (bool, optional): Run the function in a copy of the caller's
+        `contextvars` context, like `asyncio.to_thread` does. `run_in_executor` doesn't,
+        so this is off by default to avoid copying the context on every call.
+        Defaults to False.
 
     Returns:
         Callable: The new asynchronous function.
@@ -44,19 +247,48 @@ def to_async[**P, T](
     asyncio.run(main())
     ```
     """
+    if inspect.iscoroutinefunction(func):
+        return func
+
+    if inline:
+
+        async def inline_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            result = func(*args, **kwargs)
+            await asyncio.sleep(0)
+            return result
+
+        return _fast_wraps(inline_wrapper, func)
+
+    specialized = _specialize(func, loop, executor, propagate_context)
+    if specialized is not None:
+        return specialized
+
+    bound_run = loop.run_in_executor if loop is not None else None
 
-    @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        _loop = loop or asyncio.get_event_loop()
-        return await _loop.run_in_executor(
-            executor, functools.partial(func, *args, **kwargs)
+        _run = (
+            bound_run
+            if bound_run is not None
+            else asyncio.get_running_loop().run_in_executor
         )
+        _executor = executor if executor is not None else _get_default_executor()
+        if propagate_context:
+            context = contextvars.copy_context()
+            return await _run(
+                _executor, functools.partial(context.run, func, *args, **kwargs)
+            )
+        if not kwargs:
+            return await _run(_executor, func, *args)
+        return await _run(_executor, functools.partial(func, *args, **kwargs))
 
-    return wrapper
+    return _fast_wraps(wrapper, func)
 
 
 def as_async[**P, T](
-    loop: asyncio.AbstractEventLoop | None = None, executor: Executor | None = None
+    loop: asyncio.AbstractEventLoop | None = None,
+    executor: Executor | None = None,
+    inline: bool = False,
+    propagate_context: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, Coroutine[None, None, T]]]:
     """
     The `as_async` decorator is used to run a synchronous function in a separate thread,
@@ -66,9 +298,18 @@ def as_async[**P, T](
 
     Args:
         loop (asyncio.AbstractEventLoop, optional): The event loop to run the blocking function on.
-        Defaults to `asyncio.get_event_loop()`.
+        Defaults to the running loop, so calls must be made from inside one.
         executor (Executor, optional): The executor to run the blocking function on.
-        This can affect performance, check asyncio docs for info. Defaults to None.
+        This can affect performance, check asyncio docs for info. Defaults to a shared
+        `ThreadPoolExecutor` with `AS_ASYNC_THREAD_POOL_SIZE` (default 64) workers.
+        inline (bool, optional): Call the function directly on the event loop thread and
+        then yield to the loop once, instead of using the executor. This blocks the event
+        loop while the function runs, so only use it for functions that finish faster
+        than a thread hop. Defaults to False.
+        propagate_context (bool, optional): Run the function in a copy of the caller's
+        `contextvars` context, like `asyncio.to_thread` does. `run_in_executor` doesn't,
+        so this is off by default to avoid copying the context on every call.
+        Defaults to False.
 
     Example:
     ```python
@@ -76,7 +317,7 @@ def as_async[**P, T](
     import asyncio
     from concurrent.futures import ThreadPoolExecutor
 
-    @as_async(loop=asyncio.get_event_loop(), executor=ThreadPoolExecutor(max_workers=5))
+    @as_async(executor=ThreadPoolExecutor(max_workers=5))
     def long_running_function():
         time.sleep(5)
         return "Finished"
@@ -90,7 +331,13 @@ def as_async[**P, T](
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, Coroutine[None, None, T]]:
-        return to_async(func, loop=loop, executor=executor)
+        return to_async(
+            func,
+            loop=loop,
+            executor=executor,
+            inline=inline,
+            propagate_context=propagate_context,
+        )
 
     return decorator
 
@@ -99,23 +346,51 @@ def to_async_generator[**P, T](
     func: Callable[P, Generator[T, Any, None]],
     loop: asyncio.AbstractEventLoop | None = None,
     executor: Executor | None = None,
+    chunk_size: int = 1,
+    yield_every: int | None = None,
+    buffer_size: int | None = None,
+    prefetch: bool = False,
+    propagate_context: bool = False,
 ) -> Callable[P, AsyncGenerator[T, Any]]:
     """
     The `to_async_generator` function is used to convert a synchronous generator into an
     asynchronous one by running it in a separate thread, effectively making it non-blocking.
     This is useful when you have a CPU-bound or I/O-bound generator that you don't want to
-    block the event loop, and which would be difficult to reimplement as async.
+    block the event loop, and which would be difficult to reimplement as async. If `func` is
+    already an async generator function it is returned unchanged.
 
     Args:
         func (Callable): The synchronous generator to convert to asynchronous.
         loop (asyncio.AbstractEventLoop, optional): The event loop to run the blocking generator on.
-        Defaults to `asyncio.get_event_loop()`.
+        Defaults to the running loop, so calls must be made from inside one.
         executor (Executor, optional): The executor to run the blocking generator on.
-        This can affect performance, check asyncio docs for info. Defaults to None.
+        This can affect performance, check asyncio docs for info. Defaults to a shared
+        `ThreadPoolExecutor` with `AS_ASYNC_THREAD_POOL_SIZE` (default 64) workers.
+        chunk_size (int, optional): The maximum number of items to pull from the blocking
+        generator per trip to the executor. Larger values cut executor overhead for fast
+        generators, at the cost of running up to `chunk_size` items ahead of the consumer.
+        Defaults to 1.
+        yield_every (int, optional): Give other tasks a turn on the event loop after every
+        `yield_every` items, even when the next item is already available. This trades a
+        little per-item latency for fairness towards other tasks. Defaults to None.
+        buffer_size (int, optional): When set, a single worker thread drains the blocking
+        generator into a queue holding up to `buffer_size` items, instead of submitting
+        one executor call per item or chunk. The thread is held for the lifetime of the
+        async generator. Takes precedence over `chunk_size`. Defaults to None.
+        prefetch (bool, optional): Request the next item from the executor before yielding
+        the current one, so the blocking generator runs while the consumer handles the
+        previous item. Only applies when `chunk_size` is 1 and `buffer_size` is None.
+        Defaults to False.
+        propagate_context (bool, optional): Run the generator in a copy of the caller's
+        `contextvars` context, taken when iteration starts. Defaults to False.
 
     Returns:
         Callable: The new asynchronous generator.
 
+    Raises:
+        TypeError: If `executor` is a `ProcessPoolExecutor`.
+        ValueError: If `buffer_size` is less than 1.
+
     Example:
     ```python
     import time
@@ -136,30 +411,113 @@ def to_async_generator[**P, T](
     asyncio.run(main())
     ```
     """
+    if inspect.isasyncgenfunction(func):
+        return func
+    if isinstance(executor, ProcessPoolExecutor):
+        raise TypeError(
+            "to_async_generator requires a thread-based executor, "
+            "generators can't be sent to another process"
+        )
+    if buffer_size is not None and buffer_size < 1:
+        raise ValueError("buffer_size must be at least 1")
 
-    @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncGenerator[T, Any]:
-        blocking = func(*args, **kwargs)
-        _loop = loop or asyncio.get_event_loop()
-        done = object()
-
-        def get_next():
+        _loop = loop if loop is not None else asyncio.get_running_loop()
+        _run = _loop.run_in_executor
+        _executor = executor if executor is not None else _get_default_executor()
+        context = contextvars.copy_context() if propagate_context else None
+        # `func` may do blocking work before handing back an iterator, so call it in the
+        # executor as well.
+        start = func if context is None else functools.partial(context.run, func)
+        blocking = await _run(_executor, functools.partial(start, *args, **kwargs))
+        counter = 0
+
+        if buffer_size is not None:
+            queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue()
+            slots = threading.Semaphore(buffer_size)
+            stopped = threading.Event()
+            drain = (
+                _drain if context is None else functools.partial(context.run, _drain)
+            )
+            producer = _executor.submit(drain, blocking, _loop, queue, slots, stopped)
+            producer.add_done_callback(
+                functools.partial(_report_drain_failure, _loop, queue)
+            )
+            try:
+                while True:
+                    ok, obj = await queue.get()
+                    if not ok:
+                        if obj is not None:
+                            raise obj
+                        break
+                    slots.release()
+                    yield obj
+                    if yield_every and (counter := counter + 1) % yield_every == 0:
+                        await asyncio.sleep(0)
+            finally:
+                stopped.set()
+                slots.release()
+            return
+
+        if chunk_size > 1:
+            pull_chunk = (
+                _pull_chunk
+                if context is None
+                else functools.partial(context.run, _pull_chunk)
+            )
+            while True:
+                items, exhausted, error = await _run(
+                    _executor, pull_chunk, blocking, chunk_size
+                )
+                for obj in items:
+                    yield obj
+                    if yield_every and (counter := counter + 1) % yield_every == 0:
+                        await asyncio.sleep(0)
+                if error is not None:
+                    raise error
+                if exhausted:
+                    break
+            return
+
+        pull_next = (
+            _pull_next
+            if context is None
+            else functools.partial(context.run, _pull_next)
+        )
+        if prefetch:
+            pending = _run(_executor, pull_next, blocking)
             try:
-                return blocking.__next__()
-            except StopIteration:
-                return done
+                while True:
+                    ok, obj = await pending
+                    if not ok:
+                        break
+                    pending = _run(_executor, pull_next, blocking)
+                    yield obj
+                    if yield_every and (counter := counter + 1) % yield_every == 0:
+                        await asyncio.sleep(0)
+            finally:
+                pending.cancel()
+            return
 
         while True:
-            obj = await _loop.run_in_executor(executor, get_next)
-            if obj is done:
+            ok, obj = await _run(_executor, pull_next, blocking)
+            if not ok:
                 break
-            yield cast(T, obj)
+            yield obj
+            if yield_every and (counter := counter + 1) % yield_every == 0:
+                await asyncio.sleep(0)
 
-    return wrapper
+    return _fast_wraps(wrapper, func)
 
 
 def as_async_generator[**P, T](
-    loop: asyncio.AbstractEventLoop | None = None, executor: Executor | None = None
+    loop: asyncio.AbstractEventLoop | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = 1,
+    yield_every: int | None = None,
+    buffer_size: int | None = None,
+    prefetch: bool = False,
+    propagate_context: bool = False,
 ) -> Callable[
     [Callable[P, Generator[T, Any, None]]], Callable[P, AsyncGenerator[T, Any]]
 ]:
@@ -171,9 +529,27 @@ def as_async_generator[**P, T](
 
     Args:
         loop (asyncio.AbstractEventLoop, optional): The event loop to run the blocking generator on.
-        Defaults to `asyncio.get_event_loop()`.
+        Defaults to the running loop, so calls must be made from inside one.
         executor (Executor, optional): The executor to run the blocking generator on.
-        This can affect performance, check asyncio docs for info. Defaults to None.
+        This can affect performance, check asyncio docs for info. Defaults to a shared
+        `ThreadPoolExecutor` with `AS_ASYNC_THREAD_POOL_SIZE` (default 64) workers.
+        chunk_size (int, optional): The maximum number of items to pull from the blocking
+        generator per trip to the executor. Larger values cut executor overhead for fast
+        generators, at the cost of running up to `chunk_size` items ahead of the consumer.
+        Defaults to 1.
+        yield_every (int, optional): Give other tasks a turn on the event loop after every
+        `yield_every` items, even when the next item is already available. This trades a
+        little per-item latency for fairness towards other tasks. Defaults to None.
+        buffer_size (int, optional): When set, a single worker thread drains the blocking
+        generator into a queue holding up to `buffer_size` items, instead of submitting
+        one executor call per item or chunk. The thread is held for the lifetime of the
+        async generator. Takes precedence over `chunk_size`. Defaults to None.
+        prefetch (bool, optional): Request the next item from the executor before yielding
+        the current one, so the blocking generator runs while the consumer handles the
+        previous item. Only applies when `chunk_size` is 1 and `buffer_size` is None.
+        Defaults to False.
+        propagate_context (bool, optional): Run the generator in a copy of the caller's
+        `contextvars` context, taken when iteration starts. Defaults to False.
 
     Example:
     ```python
@@ -181,7 +557,7 @@ def as_async_generator[**P, T](
     import asyncio
     from concurrent.futures import ThreadPoolExecutor
 
-    @as_async_generator(loop=asyncio.get_event_loop(), executor=ThreadPoolExecutor(max_workers=5))
+    @as_async_generator(executor=ThreadPoolExecutor(max_workers=5))
     def long_running_generator():
         for i in range(5):
             time.sleep(1)  # Simulate a long-running operation
@@ -198,6 +574,15 @@ def as_async_generator[**P, T](
     def decorator(
         func: Callable[P, Generator[T, Any, None]],
     ) -> Callable[P, AsyncGenerator[T, Any]]:
-        return to_async_generator(func, loop=loop, executor=executor)
+        return to_async_generator(
+            func,
+            loop=loop,
+            executor=executor,
+            chunk_size=chunk_size,
+            yield_every=yield_every,
+            buffer_size=buffer_size,
+            prefetch=prefetch,
+            propagate_context=propagate_context,
+        )
 
     return decorator
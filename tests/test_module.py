@@ -1,4 +1,9 @@
+import asyncio
+import contextvars
+import functools
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
 
@@ -83,3 +88,286 @@ async def test_as_async_generator():
         pass
 
     assert tmp == ["foo", "buz"]
+
+
+@pytest.mark.asyncio
+async def test_to_async_forwards_arguments():
+    def add(a, b, c=0):
+        return a + b + c
+
+    a_add = to_async(add)
+
+    assert await a_add(1, 2) == 3
+    assert await a_add(1, 2, c=3) == 6
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_chunk_size():
+    def count(n):
+        yield from range(n)
+
+    for n in (0, 1, 4, 5, 6, 11):
+        a_gen = to_async_generator(count, chunk_size=5)(n)
+        assert [i async for i in a_gen] == list(range(n))
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_chunk_size_raises():
+    tmp = []
+
+    def broken():
+        yield 1
+        yield 2
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError, match="broken"):
+        async for i in to_async_generator(broken, chunk_size=5)():
+            tmp.append(i)
+
+    assert tmp == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_yields_none():
+    def nones():
+        yield None
+        yield None
+
+    a_gen = to_async_generator(nones)()
+    assert [i async for i in a_gen] == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_to_async_passes_through_coroutine_functions():
+    async def buz():
+        return "buz"
+
+    assert to_async(buz) is buz
+    assert await as_async()(buz)() == "buz"
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_passes_through_async_generators():
+    async def buz():
+        yield "buz"
+
+    assert to_async_generator(buz) is buz
+    assert [i async for i in as_async_generator()(buz)()] == ["buz"]
+
+
+@pytest.mark.asyncio
+async def test_default_executor():
+    def thread_name():
+        return threading.current_thread().name
+
+    def thread_names():
+        yield threading.current_thread().name
+
+    assert (await to_async(thread_name)()).startswith("as_async")
+    async for name in to_async_generator(thread_names)():
+        assert name.startswith("as_async")
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_yield_every():
+    tmp = []
+
+    def count():
+        yield from range(4)
+
+    async def other():
+        tmp.append("other")
+
+    async for i in to_async_generator(count, chunk_size=4, yield_every=2)():
+        if i == 0:
+            task = asyncio.create_task(other())
+        tmp.append(i)
+
+    await task
+    assert tmp == [0, 1, "other", 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_buffer_size():
+    pulled = []
+
+    def count(n):
+        for i in range(n):
+            pulled.append(i)
+            yield i
+
+    a_gen = to_async_generator(count, buffer_size=2)(5)
+    assert [i async for i in a_gen] == list(range(5))
+
+    pulled.clear()
+    async for _ in to_async_generator(count, buffer_size=2)(5):
+        await asyncio.sleep(0.05)
+        assert pulled == [0, 1, 2]
+        break
+
+
+def test_to_async_generator_rejects_empty_buffer():
+    def buz():
+        yield "buz"
+
+    with pytest.raises(ValueError):
+        to_async_generator(buz, buffer_size=0)
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_buffer_size_raises():
+    def broken():
+        yield 1
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError, match="broken"):
+        async for _ in to_async_generator(broken, buffer_size=2)():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_buffer_size_raises_base_exception():
+    class Abort(BaseException):
+        pass
+
+    def broken():
+        yield 1
+        raise Abort
+
+    async def consume():
+        return [i async for i in to_async_generator(broken, buffer_size=2)()]
+
+    with pytest.raises(Abort):
+        await asyncio.wait_for(consume(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_to_async_builtins():
+    assert await to_async(abs)(-1) == 1
+    assert await to_async(dict)(a=1) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_to_async_keeps_signature():
+    def join(a, /, b, c="c"):
+        """join three strings."""
+        return a + b + c
+
+    def join_kw(a, *, b="b"):
+        return a + b
+
+    a_join = to_async(join)
+    assert a_join.__name__ == "join"
+    assert a_join.__doc__ == "join three strings."
+    assert a_join.__wrapped__ is join
+    assert await a_join("a", "b") == "abc"
+    assert await a_join("a", b="b", c="d") == "abd"
+    with pytest.raises(TypeError):
+        await a_join(a="a", b="b")
+
+    assert await to_async(join_kw)("a", b="c") == "ac"
+
+
+@pytest.mark.asyncio
+async def test_as_async_inline():
+    tmp = []
+
+    @as_async(inline=True)
+    def buz():
+        tmp.append(threading.current_thread())
+        return "buz"
+
+    assert await buz() == "buz"
+    assert tmp == [threading.current_thread()]
+
+
+@pytest.mark.asyncio
+async def test_propagate_context():
+    var = contextvars.ContextVar("var", default="unset")
+    var.set("set")
+
+    def get(*, _=None):
+        return var.get()
+
+    def get_all():
+        yield var.get()
+
+    assert await to_async(get)() == "unset"
+    assert await to_async(get, propagate_context=True)() == "set"
+    assert await to_async(get, propagate_context=True)(_=1) == "set"
+    for kwargs in ({}, {"chunk_size": 2}, {"buffer_size": 2}):
+        a_gen = to_async_generator(get_all, propagate_context=True, **kwargs)()
+        assert [i async for i in a_gen] == ["set"]
+
+
+def test_to_async_generator_rejects_process_pool():
+    def buz():
+        yield "buz"
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(TypeError):
+            to_async_generator(buz, executor=executor)
+        with pytest.raises(TypeError):
+            as_async_generator(executor=executor)(buz)
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_prefetch():
+    pulled = []
+
+    def count(n):
+        for i in range(n):
+            pulled.append(i)
+            yield i
+
+    a_gen = to_async_generator(count, prefetch=True)(3)
+    assert [i async for i in a_gen] == [0, 1, 2]
+
+    pulled.clear()
+    async for _ in to_async_generator(count, prefetch=True)(3):
+        await asyncio.sleep(0.05)
+        assert pulled == [0, 1]
+        break
+
+
+@pytest.mark.asyncio
+async def test_to_async_explicit_loop_and_executor():
+    def add(a, b):
+        return a + b
+
+    def add_kw(a, *, b):
+        return a + b
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert await to_async(add, loop=loop, executor=executor)(1, 2) == 3
+        assert await to_async(add_kw, loop=loop, executor=executor)(1, b=2) == 3
+
+
+@pytest.mark.asyncio
+async def test_to_async_generator_creates_iterator_in_executor():
+    tmp = []
+
+    def records():
+        tmp.append(threading.current_thread())
+        return iter(["a", "b"])
+
+    a_gen = to_async_generator(records)()
+    assert [i async for i in a_gen] == ["a", "b"]
+    assert tmp[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_to_async_decorator_injecting_argument():
+    def with_session(f):
+        @functools.wraps(f)
+        def inner(*args, **kwargs):
+            return f("S", *args, **kwargs)
+
+        return inner
+
+    @with_session
+    def query(session, x):
+        return session, x
+
+    assert await to_async(query)(5) == ("S", 5)